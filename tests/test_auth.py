@@ -0,0 +1,92 @@
+"""Tests for auth module."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tradestation.auth import TradeStationAuth
+
+
+class FakeResponse:
+    """Minimal stand-in for a token endpoint response."""
+
+    def __init__(self, token):
+        self._token = token
+        self.content = f'{{"access_token": "{token}", "expires_in": 1200}}'.encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"access_token": self._token, "expires_in": 1200}
+
+
+def make_auth(monkeypatch, delay=0.0):
+    """Create an auth handler whose token endpoint returns token-1, token-2, ..."""
+    auth = TradeStationAuth("id", "secret", "refresh")
+    calls = []
+
+    def fake_post(*_args, **kwargs):
+        time.sleep(delay)
+        calls.append(kwargs)
+        return FakeResponse(f"token-{len(calls)}")
+
+    monkeypatch.setattr(auth._session, "post", fake_post)
+    return auth, calls
+
+
+class TestTradeStationAuth:
+    """Tests for TradeStationAuth."""
+
+    def test_headers_cached_until_invalidated(self, monkeypatch):
+        auth, calls = make_auth(monkeypatch)
+
+        headers = auth.headers()
+        assert headers["Authorization"] == "Bearer token-1"
+        assert auth.headers() is headers
+        assert len(calls) == 1
+
+        auth.invalidate()
+        assert auth.headers()["Authorization"] == "Bearer token-2"
+        assert len(calls) == 2
+
+    def test_get_access_token(self, monkeypatch):
+        auth, calls = make_auth(monkeypatch)
+
+        assert auth.get_access_token() == "token-1"
+        assert auth.get_access_token() == "token-1"
+        assert len(calls) == 1
+
+    def test_concurrent_refresh_hits_endpoint_once(self, monkeypatch):
+        auth, calls = make_auth(monkeypatch, delay=0.05)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: auth.headers()["Authorization"], range(8)))
+
+        assert results == ["Bearer token-1"] * 8
+        assert len(calls) == 1
+
+    def test_stale_invalidate_keeps_refreshed_token(self, monkeypatch):
+        auth, calls = make_auth(monkeypatch)
+        stale = auth.headers()
+        auth.invalidate(stale)
+        fresh = auth.headers()
+
+        auth.invalidate(stale)  # Late 401 from a request that used the old token
+
+        assert auth.headers() is fresh
+        assert len(calls) == 2
+
+    def test_invalidate_after_refresh_does_not_return_none(self, monkeypatch):
+        auth, calls = make_auth(monkeypatch)
+        refresh = auth._refresh_access_token
+
+        def refresh_then_invalidate():
+            result = refresh()
+            auth.invalidate()  # Another thread's 401 lands right after the lock is released
+            return result
+
+        monkeypatch.setattr(auth, "_refresh_access_token", refresh_then_invalidate)
+
+        assert auth.headers()["Authorization"] == "Bearer token-1"
+        assert auth.get_access_token() == "token-2"
+        assert len(calls) == 2
@@ -0,0 +1,81 @@
+"""Tests for config module."""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from tradestation.config import ConfigurationError, load_config
+from tradestation.models import StorageFormat
+
+SAMPLE_CONFIG = """
+tradestation:
+  client_id: "id"
+  client_secret: "secret"
+  refresh_token: "token"
+storage_format: "{storage_format}"
+symbols:
+  - "@ES"
+"""
+
+
+def write_config(path, storage_format="single"):
+    """Write a minimal config file."""
+    path.write_text(SAMPLE_CONFIG.format(storage_format=storage_format), encoding="utf-8")
+
+
+class TestLoadConfig:
+    """Tests for load_config."""
+
+    def test_load(self, temp_data_dir):
+        path = temp_data_dir / "config.yaml"
+        write_config(path)
+
+        config = load_config(str(path))
+
+        assert config.client_id == "id"
+        assert config.symbols == ["@ES"]
+        assert config.storage_format == StorageFormat.SINGLE
+
+    def test_unquoted_start_date(self, temp_data_dir):
+        path = temp_data_dir / "config.yaml"
+        write_config(path)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("start_date: 2015-06-01\n")
+
+        assert load_config(str(path)).start_datetime == datetime(2015, 6, 1)
+
+    def test_invalid_start_date(self, temp_data_dir):
+        path = temp_data_dir / "config.yaml"
+        write_config(path)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('start_date: "next tuesday"\n')
+
+        with pytest.raises(ConfigurationError, match="Invalid start_date"):
+            load_config(str(path))
+
+    def test_missing_file(self, temp_data_dir):
+        with pytest.raises(ConfigurationError, match="not found"):
+            load_config(str(temp_data_dir / "missing.yaml"))
+
+    def test_cached_result_is_copy(self, temp_data_dir):
+        path = temp_data_dir / "config.yaml"
+        write_config(path)
+
+        first = load_config(str(path))
+        first.symbols.append("@NQ")
+        second = load_config(str(path))
+
+        assert second.symbols == ["@ES"]
+        assert first is not second
+
+    def test_reload_on_mtime_change(self, temp_data_dir):
+        path = temp_data_dir / "config.yaml"
+        write_config(path)
+        assert load_config(str(path)).storage_format == StorageFormat.SINGLE
+
+        write_config(path, storage_format="daily")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_config(str(path)).storage_format == StorageFormat.DAILY
@@ -0,0 +1,317 @@
+"""Tests for downloader module."""
+
+import time
+from datetime import datetime
+
+from tradestation.downloader import _NUMERIC_DTYPES, TokenBucket, TradeStationDownloader
+from tradestation.models import DownloadConfig
+
+
+def make_bar(timestamp, price="100.5", volume="1000"):
+    """Create a bar dict as returned by the barcharts API."""
+    return {
+        "TimeStamp": timestamp,
+        "Open": price,
+        "High": price,
+        "Low": price,
+        "Close": price,
+        "TotalVolume": volume,
+        "DownTicks": 1,
+    }
+
+
+def to_dataframe(bars, start_date):
+    """Run bars through the column buffers and DataFrame builder."""
+    columns = TradeStationDownloader._empty_columns()
+    TradeStationDownloader._append_bars(columns, bars)
+    return TradeStationDownloader._bars_to_dataframe(columns, start_date)
+
+
+class TestBarsToDataFrame:
+    """Tests for TradeStationDownloader._bars_to_dataframe."""
+
+    def test_empty(self):
+        df = to_dataframe([], datetime(2024, 1, 1))
+        assert df.empty
+        assert list(df.columns) == ["datetime", "open", "high", "low", "close", "volume"]
+
+    def test_columns_and_types(self):
+        bars = [make_bar("2024-01-02T14:30:00Z"), make_bar("2024-01-02T14:31:00Z")]
+        df = to_dataframe(bars, datetime(2024, 1, 1))
+
+        assert list(df.columns) == ["datetime", "open", "high", "low", "close", "volume"]
+        assert df["datetime"].dt.tz is None
+        assert df["datetime"].iloc[0] == datetime(2024, 1, 2, 14, 30)
+        assert df["open"].dtype == "float64"
+        assert df["volume"].dtype == "int64"
+        assert df["close"].iloc[0] == 100.5
+
+    def test_append_bars_across_batches(self):
+        columns = TradeStationDownloader._empty_columns()
+        TradeStationDownloader._append_bars(columns, [make_bar("2024-01-02T14:31:00Z")])
+        TradeStationDownloader._append_bars(columns, [make_bar("2024-01-02T14:30:00Z", volume="5")])
+
+        assert set(columns) == {"datetime", "open", "high", "low", "close", "volume"}
+        assert len(columns["datetime"]) == 2
+        assert columns["volume"][1].dtype == "int64"
+        assert columns["volume"][1][0] == 5
+        assert columns["close"][0].dtype == "float64"
+
+        df = TradeStationDownloader._bars_to_dataframe(columns, datetime(2024, 1, 1))
+        assert list(df["volume"]) == [5, 1000]
+
+    def test_empty_batch(self):
+        columns = TradeStationDownloader._empty_columns()
+        TradeStationDownloader._append_bars(columns, [])
+
+        df = TradeStationDownloader._bars_to_dataframe(columns, datetime(2024, 1, 1))
+        assert df.empty
+        assert list(df.columns) == ["datetime", "open", "high", "low", "close", "volume"]
+
+    def test_malformed_bars_coerced_or_skipped(self):
+        missing_high = make_bar("2024-01-02T14:33:00Z")
+        del missing_high["High"]
+        bars = [
+            make_bar("garbage"),
+            make_bar("2024-01-02T14:30:00Z", volume="1000.0"),
+            make_bar("2024-01-02T14:31:00Z", price=None),
+            make_bar("2024-01-02T14:32:00Z", price="n/a"),
+            missing_high,
+            make_bar("garbage"),
+            make_bar("2024-01-02T14:34:00Z", volume=None),
+            make_bar("2024-01-02T14:34:30Z", volume="1000.7"),
+            make_bar("2024-01-02T14:34:40Z", volume=1000.7),
+            make_bar("2024-01-02T14:35:00Z"),
+        ]
+        df = to_dataframe(bars, datetime(2024, 1, 1))
+
+        assert list(df["datetime"]) == [datetime(2024, 1, 2, 14, 30), datetime(2024, 1, 2, 14, 35)]
+        assert list(df["volume"]) == [1000, 1000]
+        assert df["volume"].dtype == "int64"
+
+        columns = TradeStationDownloader._empty_columns()
+        batch_range = TradeStationDownloader._append_bars(columns, bars)
+        assert batch_range == (datetime(2024, 1, 2, 14, 30), datetime(2024, 1, 2, 14, 35))
+        assert TradeStationDownloader._append_bars(columns, [make_bar("garbage")]) is None
+        assert df["open"].dtype == "float64"
+
+    def test_numeric_dtypes(self):
+        df = to_dataframe([make_bar("2024-01-02T14:30:00Z", volume="9007199254740993")], datetime(2024, 1, 1))
+
+        for col, dtype in _NUMERIC_DTYPES.items():
+            assert df[col].dtype == dtype
+        assert df["volume"].iloc[0] == 9007199254740993
+
+    def test_fractional_seconds_timestamps(self):
+        bars = [make_bar("2024-01-02T14:30:00.500Z"), make_bar("2024-01-02T09:31:00-05:00")]
+        df = to_dataframe(bars, datetime(2024, 1, 1))
+
+        assert df["datetime"].iloc[0] == datetime(2024, 1, 2, 14, 30, 0, 500000)
+        assert df["datetime"].iloc[1] == datetime(2024, 1, 2, 14, 31)
+
+    def test_sorts_and_dedupes_keeping_last(self):
+        bars = [
+            make_bar("2024-01-02T14:31:00Z"),
+            make_bar("2024-01-02T14:30:00Z", price="1"),
+            make_bar("2024-01-02T14:30:00Z", price="2"),
+        ]
+        df = to_dataframe(bars, datetime(2024, 1, 1))
+
+        assert list(df["datetime"]) == [datetime(2024, 1, 2, 14, 30), datetime(2024, 1, 2, 14, 31)]
+        assert df["open"].iloc[0] == 2.0
+
+    def test_dedupe_keeps_last_of_interleaved_duplicates(self):
+        bars = [
+            make_bar("2024-01-02T14:31:00Z", price="1"),
+            make_bar("2024-01-02T14:30:00Z", price="1"),
+            make_bar("2024-01-02T14:31:00Z", price="2"),
+            make_bar("2024-01-02T14:30:00Z", price="2"),
+            make_bar("2024-01-02T14:31:00Z", price="3"),
+        ]
+        df = to_dataframe(bars, datetime(2024, 1, 1))
+
+        assert list(df["datetime"]) == [datetime(2024, 1, 2, 14, 30), datetime(2024, 1, 2, 14, 31)]
+        assert list(df["open"]) == [2.0, 3.0]
+
+    def test_filters_before_start_date(self):
+        bars = [
+            make_bar("2024-01-01T23:59:00Z"),
+            make_bar("2024-01-02T00:00:00Z"),
+            make_bar("2024-01-02T00:01:00Z"),
+        ]
+        df = to_dataframe(bars, datetime(2024, 1, 2))
+
+        assert len(df) == 2
+        assert df["datetime"].iloc[0] == datetime(2024, 1, 2)
+
+    def test_all_bars_before_start_date(self):
+        bars = [make_bar("2024-01-01T09:30:00Z"), make_bar("2024-01-01T09:31:00Z")]
+        df = to_dataframe(bars, datetime(2024, 1, 2))
+
+        assert df.empty
+        assert list(df.columns) == ["datetime", "open", "high", "low", "close", "volume"]
+
+    def test_start_date_between_bars(self):
+        bars = [make_bar("2024-01-02T09:30:00Z"), make_bar("2024-01-02T09:32:00Z")]
+        df = to_dataframe(bars, datetime(2024, 1, 2, 9, 31))
+
+        assert list(df["datetime"]) == [datetime(2024, 1, 2, 9, 32)]
+
+
+class TestFetchBars:
+    """Tests for TradeStationDownloader._fetch_bars pagination."""
+
+    def test_paginates_and_drops_newest_bar(self, temp_data_dir, monkeypatch):
+        config = DownloadConfig(
+            client_id="id",
+            client_secret="secret",
+            refresh_token="token",
+            data_dir=str(temp_data_dir),
+            rate_limit_delay=0,
+        )
+        downloader = TradeStationDownloader(config)
+        batches = [
+            {"Bars": [make_bar("2024-01-02T14:30:00Z"), make_bar("2024-01-02T14:31:00Z")]},
+            {"Bars": [make_bar("2024-01-01T23:59:00Z"), make_bar("2024-01-02T14:29:00Z")]},
+        ]
+        monkeypatch.setattr(downloader, "_api_request", lambda *_args, **_kwargs: batches.pop(0))
+
+        df = downloader._fetch_bars("@ES", datetime(2024, 1, 2))
+
+        assert list(df["datetime"]) == [datetime(2024, 1, 2, 14, 29), datetime(2024, 1, 2, 14, 30)]
+        assert not batches
+
+    def test_malformed_first_bar_keeps_fetched_batches(self, temp_data_dir, monkeypatch):
+        config = DownloadConfig(
+            client_id="id",
+            client_secret="secret",
+            refresh_token="token",
+            data_dir=str(temp_data_dir),
+            rate_limit_delay=0,
+        )
+        downloader = TradeStationDownloader(config)
+        no_timestamp = make_bar("2024-01-02T14:28:00Z")
+        del no_timestamp["TimeStamp"]
+        batches = [
+            {"Bars": [make_bar("garbage"), make_bar("2024-01-02T14:30:00Z"), make_bar("2024-01-02T14:31:00Z")]},
+            {"Bars": [no_timestamp, make_bar("2024-01-02T14:29:00Z")]},
+            {"Bars": [make_bar("garbage")]},
+        ]
+        monkeypatch.setattr(downloader, "_api_request", lambda *_args, **_kwargs: batches.pop(0))
+
+        df = downloader._fetch_bars("@ES", datetime(2024, 1, 2))
+
+        assert list(df["datetime"]) == [datetime(2024, 1, 2, 14, 29), datetime(2024, 1, 2, 14, 30)]
+        assert not batches
+
+
+class TestDownloadSymbol:
+    """Tests for TradeStationDownloader.download_symbol."""
+
+    def test_reuses_cached_last_timestamp(self, temp_data_dir, monkeypatch):
+        config = DownloadConfig(
+            client_id="id",
+            client_secret="secret",
+            refresh_token="token",
+            data_dir=str(temp_data_dir),
+        )
+        downloader = TradeStationDownloader(config)
+        storage_calls = []
+        fetch_starts = []
+
+        def fake_get_last_timestamp(symbol):
+            storage_calls.append(symbol)
+            return None
+
+        def fake_fetch_bars(_symbol, start_date):
+            fetch_starts.append(start_date)
+            return to_dataframe(
+                [make_bar("2024-01-02T14:30:00Z"), make_bar("2024-01-02T14:31:00Z")],
+                datetime(2024, 1, 1),
+            )
+
+        monkeypatch.setattr(downloader._storage, "get_last_timestamp", fake_get_last_timestamp)
+        monkeypatch.setattr(downloader, "_fetch_bars", fake_fetch_bars)
+
+        downloader.download_symbol("@ES")
+        downloader.download_symbol("@ES")
+
+        assert storage_calls == ["@ES"]
+        assert fetch_starts == [datetime(2007, 1, 1), datetime(2024, 1, 2, 14, 31)]
+
+
+class FakeResponse:
+    """Minimal stand-in for a barcharts API response."""
+
+    def __init__(self, content, status_code=200):
+        self.content = content
+        self.status_code = status_code
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+class TestApiRequest:
+    """Tests for TradeStationDownloader._api_request."""
+
+    def make_downloader(self, temp_data_dir, monkeypatch, responses):
+        config = DownloadConfig(
+            client_id="id",
+            client_secret="secret",
+            refresh_token="token",
+            data_dir=str(temp_data_dir),
+            rate_limit_delay=0,
+        )
+        downloader = TradeStationDownloader(config)
+        monkeypatch.setattr(downloader._auth, "headers", lambda: {"Authorization": "Bearer t"})
+        monkeypatch.setattr(downloader._session, "get", lambda *_args, **_kwargs: responses.pop(0))
+        monkeypatch.setattr(time, "sleep", lambda _seconds: None)
+        return downloader
+
+    def test_decodes_content(self, temp_data_dir, monkeypatch):
+        responses = [FakeResponse(b'{"Bars": [{"TimeStamp": "2024-01-02T14:30:00Z"}]}')]
+        downloader = self.make_downloader(temp_data_dir, monkeypatch, responses)
+
+        data = downloader._api_request("@ES", datetime(2024, 1, 2))
+
+        assert data == {"Bars": [{"TimeStamp": "2024-01-02T14:30:00Z"}]}
+
+    def test_retries_malformed_body(self, temp_data_dir, monkeypatch):
+        responses = [FakeResponse(b'{"Bars": ['), FakeResponse(b'{"Bars": []}')]
+        downloader = self.make_downloader(temp_data_dir, monkeypatch, responses)
+
+        assert downloader._api_request("@ES", datetime(2024, 1, 2)) == {"Bars": []}
+        assert not responses
+
+    def test_gives_up_after_max_retries(self, temp_data_dir, monkeypatch):
+        responses = [FakeResponse(b"not json") for _ in range(4)]
+        downloader = self.make_downloader(temp_data_dir, monkeypatch, responses)
+
+        assert downloader._api_request("@ES", datetime(2024, 1, 2)) is None
+        assert not responses
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket rate limiter."""
+
+    def test_burst_up_to_capacity(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        assert time.monotonic() - start < 0.5
+
+    def test_blocks_when_empty(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    def test_zero_rate_disables_limiting(self):
+        bucket = TokenBucket(rate=0, capacity=1)
+        start = time.monotonic()
+        for _ in range(100):
+            bucket.acquire()
+        assert time.monotonic() - start < 0.5
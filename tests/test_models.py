@@ -1,12 +1,17 @@
 """Tests for models module."""
 
+from datetime import date, datetime
+
 import pytest
 
 from tradestation.models import (
+    Compression,
     DownloadConfig,
     StorageFormat,
     get_all_symbols,
     get_symbols_by_category,
+    symbol_known,
+    ALL_SYMBOLS,
     DEFAULT_SYMBOLS,
 )
 
@@ -29,6 +34,19 @@ class TestStorageFormat:
             StorageFormat.from_string("invalid")
 
 
+class TestCompression:
+    """Tests for Compression enum."""
+
+    def test_from_string(self):
+        assert Compression.from_string("zstd") == Compression.ZSTD
+        assert Compression.from_string("SNAPPY") == Compression.SNAPPY
+        assert Compression.from_string("None") == Compression.NONE
+
+    def test_from_string_invalid(self):
+        with pytest.raises(ValueError, match="Invalid compression"):
+            Compression.from_string("brotli")
+
+
 class TestDownloadConfig:
     """Tests for DownloadConfig dataclass."""
 
@@ -52,6 +70,57 @@ class TestDownloadConfig:
         )
         assert config.storage_format == StorageFormat.MONTHLY
 
+    def test_start_date_parsed(self):
+        config = DownloadConfig(
+            client_id="id",
+            client_secret="secret",
+            refresh_token="token",
+            start_date="2020-03-15",
+        )
+        assert config.start_datetime == datetime(2020, 3, 15)
+
+    def test_start_date_reparsed_after_change(self):
+        config = DownloadConfig(client_id="id", client_secret="secret", refresh_token="token")
+        assert config.start_datetime == datetime(2007, 1, 1)
+
+        config.start_date = "2020-01-01"
+        assert config.start_datetime == datetime(2020, 1, 1)
+
+    def test_start_date_accepts_date(self):
+        config = DownloadConfig(
+            client_id="id",
+            client_secret="secret",
+            refresh_token="token",
+            start_date=date(2020, 3, 15),
+        )
+        assert config.start_datetime == datetime(2020, 3, 15)
+
+    def test_start_date_offset_normalized_to_utc(self):
+        config = DownloadConfig(
+            client_id="id",
+            client_secret="secret",
+            refresh_token="token",
+            start_date="2020-01-01T00:00+05:00",
+        )
+        assert config.start_datetime == datetime(2019, 12, 31, 19, 0)
+        assert config.start_datetime.tzinfo is None
+
+    def test_start_date_invalid(self):
+        with pytest.raises(ValueError, match="Invalid start_date"):
+            DownloadConfig(
+                client_id="id",
+                client_secret="secret",
+                refresh_token="token",
+                start_date="15/03/2020",
+            )
+        with pytest.raises(ValueError, match="Invalid start_date"):
+            DownloadConfig(
+                client_id="id",
+                client_secret="secret",
+                refresh_token="token",
+                start_date=20200315,
+            )
+
 
 class TestSymbols:
     """Tests for symbol utilities."""
@@ -62,11 +131,20 @@ class TestSymbols:
         assert "@ES" in symbols
         assert "@NQ" in symbols
 
+    def test_all_symbols_matches_categories(self):
+        assert list(ALL_SYMBOLS) == get_all_symbols()
+        assert len(ALL_SYMBOLS) == sum(len(s) for s in DEFAULT_SYMBOLS.values())
+
     def test_get_symbols_by_category(self):
         index_symbols = get_symbols_by_category("index")
         assert "@ES" in index_symbols
         assert "@NQ" in index_symbols
 
+    def test_symbol_known(self):
+        assert symbol_known("@ES")
+        assert symbol_known("@MET")
+        assert not symbol_known("@UNKNOWN")
+
     def test_get_symbols_by_category_invalid(self):
         with pytest.raises(ValueError, match="Unknown category"):
             get_symbols_by_category("invalid_category")
@@ -94,6 +94,36 @@ class TestDailyPartitionedStorage:
         assert (temp_data_dir / "ES_index_1" / "year=2024" / "month=01" / "day=15").exists()
         assert (temp_data_dir / "ES_index_1" / "year=2024" / "month=01" / "day=16").exists()
 
+    def test_append_updates_known_partitions(self, temp_data_dir):
+        storage = DailyPartitionedStorage(temp_data_dir)
+        with storage.cache_listings():
+            storage.save("ES", create_sample_df(["2024-01-15 09:30"]))
+            assert storage.get_last_timestamp("ES") == pd.Timestamp("2024-01-15 09:30")
+
+            storage.append("ES", create_sample_df(["2024-01-15 09:31", "2024-01-16 09:30"]))
+
+            assert storage.get_last_timestamp("ES") == pd.Timestamp("2024-01-16 09:30")
+            assert len(storage.load("ES")) == 3
+
+    def test_append_merges_with_partition_missing_from_listing(self, temp_data_dir):
+        storage = DailyPartitionedStorage(temp_data_dir)
+        with storage.cache_listings():
+            assert storage.load("ES") is None  # Caches an empty listing
+
+            DailyPartitionedStorage(temp_data_dir).save("ES", create_sample_df(["2024-01-15 09:30", "2024-01-15 09:31"]))
+            storage.append("ES", create_sample_df(["2024-01-15 09:32"]))
+
+        assert len(storage.load("ES")) == 3
+
+    def test_load_outside_session_sees_new_partitions(self, temp_data_dir):
+        storage = DailyPartitionedStorage(temp_data_dir)
+        assert storage.load("ES") is None
+
+        DailyPartitionedStorage(temp_data_dir).save("ES", create_sample_df(["2024-01-15 09:30"]))
+
+        assert len(storage.load("ES")) == 1
+        assert storage.get_file_size("ES") > 0
+
 
 class TestMonthlyPartitionedStorage:
     """Tests for MonthlyPartitionedStorage."""
@@ -124,6 +154,36 @@ class TestMonthlyPartitionedStorage:
         assert (temp_data_dir / "ES_index_1" / "year_month=2024-01").exists()
         assert (temp_data_dir / "ES_index_1" / "year_month=2024-02").exists()
 
+    def test_append_updates_known_partitions(self, temp_data_dir):
+        storage = MonthlyPartitionedStorage(temp_data_dir)
+        with storage.cache_listings():
+            storage.save("ES", create_sample_df(["2024-01-15 09:30"]))
+            assert storage.get_last_timestamp("ES") == pd.Timestamp("2024-01-15 09:30")
+
+            storage.append("ES", create_sample_df(["2024-01-15 09:31", "2024-02-15 09:30"]))
+
+            assert storage.get_last_timestamp("ES") == pd.Timestamp("2024-02-15 09:30")
+            assert len(storage.load("ES")) == 3
+
+    def test_append_merges_with_partition_missing_from_listing(self, temp_data_dir):
+        storage = MonthlyPartitionedStorage(temp_data_dir)
+        with storage.cache_listings():
+            assert storage.load("ES") is None  # Caches an empty listing
+
+            MonthlyPartitionedStorage(temp_data_dir).save("ES", create_sample_df(["2024-01-15 09:30", "2024-01-15 09:31"]))
+            storage.append("ES", create_sample_df(["2024-01-15 09:32"]))
+
+        assert len(storage.load("ES")) == 3
+
+    def test_load_outside_session_sees_new_partitions(self, temp_data_dir):
+        storage = MonthlyPartitionedStorage(temp_data_dir)
+        assert storage.load("ES") is None
+
+        MonthlyPartitionedStorage(temp_data_dir).save("ES", create_sample_df(["2024-01-15 09:30"]))
+
+        assert len(storage.load("ES")) == 1
+        assert storage.get_file_size("ES") > 0
+
 
 class TestCreateStorage:
     """Tests for create_storage factory function."""
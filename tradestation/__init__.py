@@ -15,7 +15,15 @@ Quick Start:
 from .auth import AuthenticationError, TradeStationAuth
 from .config import ConfigurationError, load_config
 from .downloader import DownloadStats, TradeStationDownloader
-from .models import DEFAULT_SYMBOLS, Compression, DownloadConfig, StorageFormat, get_all_symbols
+from .models import (
+    ALL_SYMBOLS,
+    DEFAULT_SYMBOLS,
+    Compression,
+    DownloadConfig,
+    StorageFormat,
+    get_all_symbols,
+    symbol_known,
+)
 from .storage import StorageBackend, create_storage, detect_storage_format
 
 __version__ = "1.0.7"
@@ -32,7 +40,9 @@ __all__ = [
     "create_storage",
     "detect_storage_format",
     "DEFAULT_SYMBOLS",
+    "ALL_SYMBOLS",
     "get_all_symbols",
+    "symbol_known",
     "AuthenticationError",
     "ConfigurationError",
 ]
@@ -4,6 +4,7 @@ TradeStation OAuth2 authentication handler.
 
 import logging
 from datetime import datetime, timedelta
+from threading import Lock
 
 import requests
 
@@ -43,6 +44,9 @@ class TradeStationAuth:
         self._refresh_token = refresh_token
         self._access_token: str | None = None
         self._token_expiry: datetime | None = None
+        self._headers: dict[str, str] | None = None  # Cached request headers for current token
+        self._session = requests.Session()
+        self._refresh_lock = Lock()  # Only one thread refreshes at a time
 
     def get_access_token(self) -> str:
         """
@@ -54,9 +58,24 @@ class TradeStationAuth:
         Raises:
             AuthenticationError: If token refresh fails
         """
-        if not self._is_token_valid():
-            self._refresh_access_token()
-        return self._access_token
+        token = self._access_token
+        if token is None or not self._is_token_valid():
+            token = self._refresh_access_token()[0]
+        return token
+
+    def headers(self) -> dict[str, str]:
+        """
+        Get API request headers with a valid bearer token, refreshing if necessary.
+
+        The returned dict is cached until the token changes and must not be modified.
+
+        Raises:
+            AuthenticationError: If token refresh fails
+        """
+        headers = self._headers
+        if headers is None or not self._is_token_valid():
+            headers = self._refresh_access_token()[1]
+        return headers
 
     def _is_token_valid(self) -> bool:
         """Check if the current token is valid and not near expiration."""
@@ -65,40 +84,67 @@ class TradeStationAuth:
         buffer = timedelta(minutes=self.REFRESH_BUFFER_MINUTES)
         return datetime.now() < (self._token_expiry - buffer)
 
-    def _refresh_access_token(self) -> None:
+    def _refresh_access_token(self) -> tuple[str, dict[str, str]]:
         """
         Refresh the access token using the refresh token.
 
+        Concurrent callers wait for a single refresh instead of each hitting the
+        token endpoint.
+
+        Returns:
+            The (token, headers) that were valid under the lock, so callers are not
+            affected by a concurrent invalidate() after it is released
+
         Raises:
             AuthenticationError: If the refresh request fails
         """
-        logger.info("Refreshing access token...")
-
-        payload = {
-            "grant_type": "refresh_token",
-            "client_id": self._client_id,
-            "client_secret": self._client_secret,
-            "refresh_token": self._refresh_token,
-        }
-
-        try:
-            response = requests.post(self.TOKEN_URL, data=payload, timeout=30)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            raise AuthenticationError(f"Token refresh failed: {e}") from e
-
-        data = response.json()
-
-        if "access_token" not in data:
-            raise AuthenticationError(f"Invalid token response: {data}")
-
-        self._access_token = data["access_token"]
-        expires_in = data.get("expires_in", 1200)  # Default 20 minutes
-        self._token_expiry = datetime.now() + timedelta(seconds=expires_in)
-
-        logger.info("Token refreshed, expires in %ds", expires_in)
+        with self._refresh_lock:
+            if self._headers is not None and self._is_token_valid():
+                return self._access_token, self._headers  # Another thread refreshed while we waited
+
+            logger.info("Refreshing access token...")
+
+            payload = {
+                "grant_type": "refresh_token",
+                "client_id": self._client_id,
+                "client_secret": self._client_secret,
+                "refresh_token": self._refresh_token,
+            }
+
+            try:
+                response = self._session.post(self.TOKEN_URL, data=payload, timeout=30)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                raise AuthenticationError(f"Token refresh failed: {e}") from e
+
+            data = response.json()
+
+            if "access_token" not in data:
+                raise AuthenticationError(f"Invalid token response: {data}")
+
+            self._access_token = data["access_token"]
+            expires_in = data.get("expires_in", 1200)  # Default 20 minutes
+            self._token_expiry = datetime.now() + timedelta(seconds=expires_in)
+            self._headers = {
+                "Authorization": f"Bearer {self._access_token}",
+                "Content-Type": "application/json",
+            }
+
+            logger.info("Token refreshed, expires in %ds", expires_in)
+            return self._access_token, self._headers
+
+    def invalidate(self, headers: dict[str, str] | None = None) -> None:
+        """
+        Invalidate the current token, forcing a refresh on next use.
 
-    def invalidate(self) -> None:
-        """Invalidate the current token, forcing a refresh on next use."""
-        self._access_token = None
-        self._token_expiry = None
+        Args:
+            headers: Headers of the request that was rejected. If given, the token
+                is only invalidated if it is still current, so a token that another
+                thread has just refreshed is kept.
+        """
+        with self._refresh_lock:
+            if headers is not None and headers is not self._headers:
+                return
+            self._access_token = None
+            self._token_expiry = None
+            self._headers = None
@@ -149,7 +149,7 @@ def run_download(args: argparse.Namespace) -> int:
     if args.symbols:
         config.symbols = args.symbols
     elif args.category:
-        config.symbols = DEFAULT_SYMBOLS[args.category]
+        config.symbols = list(DEFAULT_SYMBOLS[args.category])
 
     # Override storage format if provided
     if args.storage_format:
@@ -2,10 +2,16 @@
 Configuration loading and validation.
 """
 
+import copy
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
 from .models import Compression, DownloadConfig, StorageFormat, get_all_symbols
 
 
@@ -13,10 +19,17 @@ class ConfigurationError(Exception):
     """Raised when configuration is invalid or missing."""
 
 
+# Parsed configs keyed by resolved path -> (mtime_ns, config)
+_CACHE: dict[str, tuple[int, DownloadConfig]] = {}
+
+
 def load_config(config_path: str = "config.yaml") -> DownloadConfig:
     """
     Load configuration from a YAML file.
 
+    Parsed results are cached per file and reused until the file's
+    modification time changes. Each call returns an independent copy.
+
     Args:
         config_path: Path to the configuration file
 
@@ -35,13 +48,21 @@ def load_config(config_path: str = "config.yaml") -> DownloadConfig:
             "See config.yaml.template for an example."
         )
 
+    cache_key = str(config_file.resolve())
+    mtime_ns = config_file.stat().st_mtime_ns
+    cached = _CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return copy.deepcopy(cached[1])
+
     try:
         with open(config_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_Loader)
     except yaml.YAMLError as e:
         raise ConfigurationError(f"Invalid YAML in {config_path}: {e}") from e
 
-    return _parse_config(data)
+    config = _parse_config(data)
+    _CACHE[cache_key] = (mtime_ns, config)
+    return copy.deepcopy(config)
 
 
 def _parse_config(data: dict) -> DownloadConfig:
@@ -75,21 +96,24 @@ def _parse_config(data: dict) -> DownloadConfig:
     except ValueError as e:
         raise ConfigurationError(str(e)) from e
 
-    return DownloadConfig(
-        client_id=ts_config["client_id"],
-        client_secret=ts_config["client_secret"],
-        refresh_token=ts_config["refresh_token"],
-        data_dir=data.get("data_dir", "./data"),
-        start_date=data.get("start_date", "2007-01-01"),
-        symbols=symbols,
-        interval=data.get("interval", 1),
-        unit=data.get("unit", "Minute"),
-        max_bars_per_request=data.get("max_bars_per_request", 57600),
-        rate_limit_delay=data.get("rate_limit_delay", 0.2),
-        max_retries=data.get("max_retries", 3),
-        storage_format=storage_format,
-        compression=compression,
-    )
+    try:
+        return DownloadConfig(
+            client_id=ts_config["client_id"],
+            client_secret=ts_config["client_secret"],
+            refresh_token=ts_config["refresh_token"],
+            data_dir=data.get("data_dir", "./data"),
+            start_date=data.get("start_date", "2007-01-01"),
+            symbols=symbols,
+            interval=data.get("interval", 1),
+            unit=data.get("unit", "Minute"),
+            max_bars_per_request=data.get("max_bars_per_request", 57600),
+            rate_limit_delay=data.get("rate_limit_delay", 0.2),
+            max_retries=data.get("max_retries", 3),
+            storage_format=storage_format,
+            compression=compression,
+        )
+    except ValueError as e:
+        raise ConfigurationError(str(e)) from e
 
 
 def create_template_config(output_path: str = "config.yaml.template") -> None:
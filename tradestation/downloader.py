@@ -8,11 +8,18 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from threading import Lock
+from threading import Condition, Lock
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    from json import loads as _json_loads
 
 from .auth import TradeStationAuth
 from .models import DownloadConfig
@@ -31,6 +38,71 @@ _COLUMN_MAP = {
 }
 _OUTPUT_COLUMNS = ["datetime", "open", "high", "low", "close", "volume"]
 
+# Fixed dtypes for the numeric output columns (the API sends them as strings)
+_NUMERIC_DTYPES = {
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.int64,
+}
+
+# Timestamp format used by the API (ISO-8601, UTC, whole seconds)
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _parse_timestamps(timestamps: list[str]) -> pd.DatetimeIndex:
+    """Parse API timestamps to naive UTC datetimes."""
+    try:
+        parsed = pd.to_datetime(timestamps, format=_TIMESTAMP_FORMAT, utc=True, cache=True)
+    except ValueError:
+        # Fractional seconds or offsets: fall back to general ISO-8601 parsing (bad values -> NaT)
+        parsed = pd.to_datetime(timestamps, format="ISO8601", utc=True, errors="coerce")
+    return parsed.tz_convert(None)
+
+
+def _to_numeric(values: list, dtype: type) -> np.ndarray:
+    """Convert API values to `dtype`, coercing odd values to float (NaN where unparseable)."""
+    try:
+        # numpy truncates float objects when casting to an integer dtype: take the coercing path
+        if np.dtype(dtype).kind == "i" and float in set(map(type, values)):
+            raise TypeError("float values for integer column")
+        return np.array(values, dtype=dtype)
+    except (ValueError, TypeError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    `acquire()` blocks only while the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self._rate = rate
+        self._capacity = max(1, capacity)
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._cond = Condition()
+
+    def acquire(self) -> None:
+        """Take one token, waiting for a refill if none are available."""
+        if self._rate <= 0:
+            return  # Rate limiting disabled
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                self._cond.wait((1 - self._tokens) / self._rate)
+
 
 @dataclass
 class DownloadStats:
@@ -79,6 +151,21 @@ class TradeStationDownloader:
         )
         self._stats = DownloadStats()
         self._stats_lock = Lock()  # Thread-safe stats updates
+        self._last_ts_cache: dict[str, datetime] = {}  # Last stored bar per symbol this session
+
+        # Shared across workers so the combined request rate respects rate_limit_delay
+        rate = 1 / config.rate_limit_delay if config.rate_limit_delay > 0 else 0
+        self._rate_limiter = TokenBucket(rate=rate, capacity=config.max_workers)
+
+        # Shared session reuses connections (and TLS) across requests and workers.
+        # All requests go to one host, so a single bounded pool with one socket per
+        # worker is enough; blocking keeps workers from opening throwaway connections.
+        workers = max(1, config.max_workers)
+        self._session = requests.Session()
+        self._session.mount(
+            self.BASE_URL,
+            HTTPAdapter(pool_connections=1, pool_maxsize=workers, pool_block=True, max_retries=0),
+        )
 
     @property
     def stats(self) -> DownloadStats:
@@ -96,16 +183,18 @@ class TradeStationDownloader:
             return self._stats
 
         self._stats = DownloadStats(start_time=datetime.now())
+        self._last_ts_cache.clear()  # Only trust cached timestamps within one session
         self._log_start(symbols, incremental)
 
         max_workers = self.config.max_workers
 
-        if max_workers <= 1:
-            # Sequential download (original behavior)
-            self._download_sequential(symbols, incremental)
-        else:
-            # Parallel download
-            self._download_parallel(symbols, incremental, max_workers)
+        with self._storage.cache_listings():
+            if max_workers <= 1:
+                # Sequential download (original behavior)
+                self._download_sequential(symbols, incremental)
+            else:
+                # Parallel download
+                self._download_parallel(symbols, incremental, max_workers)
 
         self._stats.end_time = datetime.now()
         self._log_summary()
@@ -127,9 +216,6 @@ class TradeStationDownloader:
                     self._stats.errors += 1
                     self._stats.failed_symbols.append(symbol)
 
-            if i < len(symbols):
-                time.sleep(0.2)
-
     def _download_parallel(
         self,
         symbols: list[str],
@@ -138,6 +224,7 @@ class TradeStationDownloader:
     ) -> None:
         """Download symbols in parallel using ThreadPoolExecutor."""
         total = len(symbols)
+        max_workers = min(max_workers, total)  # Don't spawn threads that would sit idle
 
         logger.info("Using %d parallel workers", max_workers)
 
@@ -166,12 +253,14 @@ class TradeStationDownloader:
 
         Returns (start_date, has_existing_data).
         """
-        config_start = datetime.strptime(self.config.start_date, "%Y-%m-%d")
+        config_start = self.config.start_datetime
 
         if not incremental:
             return config_start, False
 
-        last_timestamp = self._storage.get_last_timestamp(symbol)
+        last_timestamp = self._last_ts_cache.get(symbol)
+        if last_timestamp is None:
+            last_timestamp = self._storage.get_last_timestamp(symbol)
         if last_timestamp is None:
             return config_start, False
 
@@ -200,6 +289,7 @@ class TradeStationDownloader:
 
         # Use optimized append - only updates affected partitions for partitioned storage
         self._storage.append(symbol, new_df)
+        self._last_ts_cache[symbol] = new_df["datetime"].iloc[-1].to_pydatetime()
 
         with self._stats_lock:
             self._stats.symbols_processed += 1
@@ -213,7 +303,7 @@ class TradeStationDownloader:
 
     def _fetch_bars(self, symbol: str, start_date: datetime) -> pd.DataFrame:
         """Fetch all bars for a symbol from start_date to now."""
-        all_bars = []
+        columns = self._empty_columns()
         current_end = datetime.now(timezone.utc).replace(tzinfo=None)
         batch_num = 0
 
@@ -224,21 +314,24 @@ class TradeStationDownloader:
                 break
 
             bars = data["Bars"]
-            all_bars.extend(bars)
+            # The first batch ends at the newest bar, which is still incomplete: skip it
+            batch_range = self._append_bars(columns, bars, drop_newest=not batch_num)
             batch_num += 1
 
-            oldest = pd.to_datetime(bars[0]["TimeStamp"]).replace(tzinfo=None)
-            newest = pd.to_datetime(bars[-1]["TimeStamp"]).replace(tzinfo=None)
-            logger.info("  [%s] Batch %d: %d bars (%s to %s)", symbol, batch_num, len(bars), oldest.date(), newest.date())
+            if batch_range is None:
+                logger.warning("  [%s] Batch %d has no valid timestamps, stopping", symbol, batch_num)
+                break
+
+            oldest, newest = batch_range
+            logger.info("  [%s] Batch %d: %d bars (%s to %s)",
+                        symbol, batch_num, len(bars), oldest.date(), newest.date())
 
             if oldest <= start_date:
                 break
 
             current_end = oldest - timedelta(minutes=1)
-            time.sleep(self.config.rate_limit_delay)
 
-        df = self._bars_to_dataframe(all_bars, start_date)
-        return df.iloc[:-1] if len(df) > 0 else df  # Drop last (incomplete) bar
+        return self._bars_to_dataframe(columns, start_date)
 
     def _api_request(
         self,
@@ -253,15 +346,13 @@ class TradeStationDownloader:
             "interval": self.config.interval,
             "unit": self.config.unit,
             "barsback": barsback or self.config.max_bars_per_request,
-            "lastdate": last_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        }
-        headers = {
-            "Authorization": f"Bearer {self._auth.get_access_token()}",
-            "Content-Type": "application/json",
+            "lastdate": last_date.strftime(_TIMESTAMP_FORMAT),
         }
 
         try:
-            resp = requests.get(url, headers=headers, params=params, timeout=60)
+            self._rate_limiter.acquire()
+            headers = self._auth.headers()
+            resp = self._session.get(url, headers=headers, params=params, timeout=60)
 
             if resp.status_code == 429:
                 wait = int(resp.headers.get("Retry-After", 60))
@@ -271,13 +362,13 @@ class TradeStationDownloader:
 
             if resp.status_code == 401:
                 logger.info("Token expired, refreshing...")
-                self._auth.invalidate()
+                self._auth.invalidate(headers)
                 return self._api_request(symbol, last_date, barsback, retry)
 
             resp.raise_for_status()
-            return resp.json()
+            return _json_loads(resp.content)
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             if retry < self.config.max_retries:
                 wait = 2 ** retry
                 logger.warning("Request failed: %s. Retrying in %ds...", e, wait)
@@ -287,27 +378,80 @@ class TradeStationDownloader:
             return None
 
     @staticmethod
-    def _bars_to_dataframe(bars: list[dict], start_date: datetime) -> pd.DataFrame:
-        """Convert API bars to DataFrame."""
-        if not bars:
-            return pd.DataFrame(columns=_OUTPUT_COLUMNS)
+    def _empty_columns() -> dict[str, list[np.ndarray]]:
+        """Create empty per-field buffers for accumulating bars."""
+        return {out: [] for out in _COLUMN_MAP.values()}
+
+    @staticmethod
+    def _append_bars(
+        columns: dict[str, list[np.ndarray]],
+        bars: list[dict],
+        drop_newest: bool = False,
+    ) -> tuple[datetime, datetime] | None:
+        """Convert a batch of API bars to typed arrays and append them to the per-field buffers.
+
+        Bars with a missing or unparseable field are logged and skipped. With `drop_newest`,
+        the batch's last (newest) bar is left out as well.
+
+        Returns the (oldest, newest) valid timestamps of the batch, or None if it has none.
+        """
+        timestamps = _parse_timestamps([bar.get("TimeStamp") for bar in bars]).values
+        has_timestamp = ~np.isnat(timestamps)
+        valid = has_timestamp.copy()
+        numeric = {}
+        for key, out in _COLUMN_MAP.items():
+            if out in _NUMERIC_DTYPES:
+                dtype = _NUMERIC_DTYPES[out]
+                numeric[out] = values = _to_numeric([bar.get(key) for bar in bars], dtype)
+                if values.dtype.kind == "f":
+                    valid &= ~np.isnan(values)
+                    if np.dtype(dtype).kind == "i":
+                        valid &= values == np.floor(values)  # Don't truncate fractional values
+
+        if not valid.all():
+            logger.warning("Skipping %d malformed bars", len(valid) - int(valid.sum()))
+
+        batch_range = None
+        if has_timestamp.any():
+            known = timestamps[has_timestamp]
+            batch_range = (
+                known.min().astype("datetime64[us]").item(),
+                known.max().astype("datetime64[us]").item(),
+            )
+
+        if drop_newest and len(valid):
+            valid[-1] = False
+        if not valid.all():
+            timestamps = timestamps[valid]
+            numeric = {col: values[valid] for col, values in numeric.items()}
+
+        columns["datetime"].append(timestamps)
+        for col, values in numeric.items():
+            columns[col].append(values.astype(_NUMERIC_DTYPES[col], copy=False))
+        return batch_range
 
-        df = pd.DataFrame(bars)
-        df["TimeStamp"] = pd.to_datetime(df["TimeStamp"])
-        if df["TimeStamp"].dt.tz is not None:
-            df["TimeStamp"] = df["TimeStamp"].dt.tz_convert(None)
+    @staticmethod
+    def _bars_to_dataframe(columns: dict[str, list[np.ndarray]], start_date: datetime) -> pd.DataFrame:
+        """Convert per-field bar buffers to DataFrame."""
+        # Concatenating the batch arrays allocates each output column once, at its final size
+        timestamps = np.concatenate(columns["datetime"]) if columns["datetime"] else None
+        if timestamps is None or not len(timestamps):
+            return pd.DataFrame(columns=_OUTPUT_COLUMNS)
 
-        df = df.rename(columns=_COLUMN_MAP)
-        df = df[[c for c in _OUTPUT_COLUMNS if c in df.columns]]
+        # Stable sort by time, then keep the last bar of each run of equal timestamps
+        order = np.argsort(timestamps, kind="stable")
+        timestamps = timestamps[order]
+        keep = np.append(timestamps[1:] != timestamps[:-1], True)
+        order, timestamps = order[keep], timestamps[keep]
 
-        # Convert OHLCV to numeric types
-        for col in ["open", "high", "low", "close", "volume"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
+        # Sorted, so the start_date cut point can be found by binary search
+        start = timestamps.searchsorted(np.datetime64(start_date), side="left")
+        order, timestamps = order[start:], timestamps[start:]
 
-        df = df.sort_values("datetime").drop_duplicates(subset=["datetime"], keep="last")
-        df = df[df["datetime"] >= start_date]
-        return df.reset_index(drop=True)
+        data = {"datetime": timestamps}
+        for col in _NUMERIC_DTYPES:
+            data[col] = np.concatenate(columns[col])[order]
+        return pd.DataFrame(data, copy=False)
 
     def _log_start(self, symbols: list[str], incremental: bool) -> None:
         logger.info("")
@@ -2,8 +2,11 @@
 Data models and configuration for TradeStation downloader.
 """
 
+import itertools
 from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
 from enum import Enum
+from typing import ClassVar
 
 
 class StorageFormat(Enum):
@@ -13,14 +16,19 @@ class StorageFormat(Enum):
     DAILY = "daily"      # Partitioned by day: ES/year=2024/month=01/day=15/ES.parquet
     MONTHLY = "monthly"  # Partitioned by month: ES/year_month=2024-01/data-0.parquet
 
+    _FROM_STRING_LOOKUP: ClassVar[dict[str, "StorageFormat"]]
+
     @classmethod
     def from_string(cls, value: str) -> "StorageFormat":
         """Create StorageFormat from string value."""
         try:
-            return cls(value.lower())
-        except ValueError:
+            return cls._FROM_STRING_LOOKUP[value.lower()]
+        except KeyError:
             valid = ", ".join(f"'{f.value}'" for f in cls)
-            raise ValueError(f"Invalid storage format: '{value}'. Must be one of: {valid}")
+            raise ValueError(f"Invalid storage format: '{value}'. Must be one of: {valid}") from None
+
+
+StorageFormat._FROM_STRING_LOOKUP = {f.value: f for f in StorageFormat}
 
 
 class Compression(Enum):
@@ -32,14 +40,35 @@ class Compression(Enum):
     LZ4 = "lz4"          # Fastest, lower compression
     NONE = "none"        # No compression
 
+    _FROM_STRING_LOOKUP: ClassVar[dict[str, "Compression"]]
+
     @classmethod
     def from_string(cls, value: str) -> "Compression":
         """Create Compression from string value."""
         try:
-            return cls(value.lower())
-        except ValueError:
+            return cls._FROM_STRING_LOOKUP[value.lower()]
+        except KeyError:
             valid = ", ".join(f"'{c.value}'" for c in cls)
-            raise ValueError(f"Invalid compression: '{value}'. Must be one of: {valid}")
+            raise ValueError(f"Invalid compression: '{value}'. Must be one of: {valid}") from None
+
+
+Compression._FROM_STRING_LOOKUP = {c.value: c for c in Compression}
+
+
+def _parse_start_date(value: str | date) -> datetime:
+    """Parse a start date (ISO string, date or datetime) to a naive UTC datetime."""
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):  # Unquoted YAML dates load as datetime.date
+        parsed = datetime.combine(value, time.min)
+    else:
+        try:
+            parsed = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid start_date: '{value}'. Expected YYYY-MM-DD") from None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
 
 
 @dataclass
@@ -50,7 +79,7 @@ class DownloadConfig:
     client_secret: str
     refresh_token: str
     data_dir: str = "./data"
-    start_date: str = "2007-01-01"
+    start_date: str | date = "2007-01-01"
     symbols: list[str] = field(default_factory=list)
     interval: int = 1
     unit: str = "Minute"
@@ -61,55 +90,69 @@ class DownloadConfig:
     storage_format: StorageFormat = StorageFormat.SINGLE
     compression: Compression = Compression.ZSTD
     datetime_index: bool = True  # Save with datetime as index (adds _index_1 suffix)
+    # (start_date, parsed) for the last parsed start_date value
+    _start_cache: tuple[str | date, datetime] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate and convert fields after initialization."""
+        self._start_cache = (self.start_date, _parse_start_date(self.start_date))
         if isinstance(self.storage_format, str):
             self.storage_format = StorageFormat.from_string(self.storage_format)
         if isinstance(self.compression, str):
             self.compression = Compression.from_string(self.compression)
 
+    @property
+    def start_datetime(self) -> datetime:
+        """start_date as a naive UTC datetime, re-parsed only when start_date changes."""
+        cached = self._start_cache
+        if cached is None or cached[0] != self.start_date:
+            cached = (self.start_date, _parse_start_date(self.start_date))
+            self._start_cache = cached
+        return cached[1]
+
 
 # Default US Futures symbols organized by category
-DEFAULT_SYMBOLS = {
-    "index": [
+DEFAULT_SYMBOLS: dict[str, tuple[str, ...]] = {
+    "index": (
         "@ES",    # E-Mini S&P 500
         "@NQ",    # E-Mini Nasdaq 100
         "@YM",    # E-Mini DJIA ($5)
         "@RTY",   # E-mini Russell 2000
         "@EMD",   # E-Mini S&P Mid Cap 400
         "@SMC",   # E-Mini S&P Small Cap 600
-    ],
-    "micro_index": [
+    ),
+    "micro_index": (
         "@MES",   # Micro E-mini S&P 500
         "@MNQ",   # Micro E-mini Nasdaq-100
         "@MYM",   # Micro E-mini Dow
         "@M2K",   # Micro E-mini Russell 2000
-    ],
-    "energy": [
+    ),
+    "energy": (
         "@CL",    # Light Sweet Crude Oil
         "@NG",    # Natural Gas
         "@RB",    # RBOB Gasoline
         "@HO",    # Heating Oil
         "@BRN",   # Brent Crude Oil
-    ],
-    "micro_energy": [
+    ),
+    "micro_energy": (
         "@MCL",   # Micro Crude Oil
         "@MNG",   # Micro Henry Hub Natural Gas
-    ],
-    "metals": [
+    ),
+    "metals": (
         "@GC",    # Gold (COMEX)
         "@SI",    # Silver (COMEX)
         "@HG",    # Copper (COMEX)
         "@PL",    # Platinum
         "@PA",    # Palladium
-    ],
-    "micro_metals": [
+    ),
+    "micro_metals": (
         "@MGC",   # E-Micro Gold
         "@SIL",   # E-Micro Silver
         "@MHG",   # Micro Copper
-    ],
-    "treasuries": [
+    ),
+    "treasuries": (
         "@US",    # 30 Year US Treasury Bond
         "@TY",    # 10 Year US Treasury Note
         "@FV",    # 5 Year US Treasury Note
@@ -117,29 +160,29 @@ DEFAULT_SYMBOLS = {
         "@UB",    # Ultra T-Bond
         "@TEN",   # Ultra 10-Year Treasury Note
         "@TWE",   # 20 Year US Treasury Bond
-    ],
-    "grains": [
+    ),
+    "grains": (
         "@C",     # Corn
         "@S",     # Soybeans
         "@W",     # Wheat
         "@KW",    # KC Wheat (Hard Red Winter)
         "@BO",    # Soybean Oil
         "@SM",    # Soybean Meal
-    ],
-    "softs": [
+    ),
+    "softs": (
         "@KC",    # Coffee "C"
         "@SB",    # Sugar No. 11
         "@CT",    # Cotton No. 2
         "@CC",    # Cocoa
         "@OJ",    # FCOJ-A (Orange Juice)
         "@LBR",   # Lumber
-    ],
-    "meats": [
+    ),
+    "meats": (
         "@LC",    # Live Cattle
         "@LH",    # Lean Hogs
         "@FC",    # Feeder Cattle
-    ],
-    "currencies": [
+    ),
+    "currencies": (
         "@EC",    # Euro / US Dollar
         "@JY",    # Japanese Yen / US Dollar
         "@BP",    # British Pound / US Dollar
@@ -147,22 +190,29 @@ DEFAULT_SYMBOLS = {
         "@CD",    # Canadian Dollar / US Dollar
         "@SF",    # Swiss Franc / US Dollar
         "@DX",    # U.S. Dollar Index
-    ],
-    "volatility": [
+    ),
+    "volatility": (
         "@VX",    # CBOE Volatility Index (VIX)
-    ],
-    "crypto": [
+    ),
+    "crypto": (
         "@BTC",   # CME Bitcoin Futures
         "@ETH",   # CME Ether Futures
         "@MBT",   # CME Micro Bitcoin Futures
         "@MET",   # CME Micro Ether Futures
-    ],
+    ),
 }
 
 
+# Flat tuple of all default symbols, in category order
+ALL_SYMBOLS: tuple[str, ...] = tuple(itertools.chain.from_iterable(DEFAULT_SYMBOLS.values()))
+
+# Flat set of all default symbols for O(1) membership checks
+_ALL_SYMBOLS_SET = frozenset(ALL_SYMBOLS)
+
+
 def get_all_symbols() -> list[str]:
     """Get flat list of all default symbols."""
-    return [symbol for symbols in DEFAULT_SYMBOLS.values() for symbol in symbols]
+    return list(ALL_SYMBOLS)
 
 
 def get_symbols_by_category(category: str) -> list[str]:
@@ -170,4 +220,9 @@ def get_symbols_by_category(category: str) -> list[str]:
     if category not in DEFAULT_SYMBOLS:
         valid = ", ".join(DEFAULT_SYMBOLS.keys())
         raise ValueError(f"Unknown category: '{category}'. Valid categories: {valid}")
-    return DEFAULT_SYMBOLS[category]
+    return list(DEFAULT_SYMBOLS[category])
+
+
+def symbol_known(symbol: str) -> bool:
+    """Check whether a symbol is in the default symbol list."""
+    return symbol in _ALL_SYMBOLS_SET
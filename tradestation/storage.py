@@ -4,6 +4,8 @@ Storage backends for market data persistence.
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -47,11 +49,49 @@ class StorageBackend(ABC):
         # Convert "none" to None for pandas (no compression)
         self.compression = None if compression == "none" else compression
         self.datetime_index = datetime_index
+        # Partition files per symbol, cached only inside cache_listings() (partitioned backends)
+        self._partition_files: dict[str, set[Path]] | None = None
 
     def _get_symbol_folder(self, symbol: str) -> str:
         """Get folder name with optional _index_1 suffix."""
         return f"{symbol}_index_1" if self.datetime_index else symbol
 
+    @contextmanager
+    def cache_listings(self) -> Iterator[None]:
+        """Cache partition directory listings for the duration of the block.
+
+        Meant for a single download session: files written by other processes or
+        backend instances while the block is active are not picked up.
+        """
+        self._partition_files = {}
+        try:
+            yield
+        finally:
+            self._partition_files = None
+
+    def _scan_partition_files(self, symbol: str, pattern: str) -> set[Path]:
+        """List partition files for a symbol on disk."""
+        symbol_dir = self.data_dir / self._get_symbol_folder(symbol)
+        return set(symbol_dir.glob(pattern)) if symbol_dir.exists() else set()
+
+    def _known_partition_files(self, symbol: str, pattern: str) -> set[Path]:
+        """Get partition files for a symbol, from the listing cache when one is active."""
+        if self._partition_files is None:
+            return self._scan_partition_files(symbol, pattern)
+        files = self._partition_files.get(symbol)
+        if files is None:
+            files = self._partition_files[symbol] = self._scan_partition_files(symbol, pattern)
+        return files
+
+    def _get_partition_files(self, symbol: str, pattern: str) -> list[Path]:
+        """Get sorted partition files for a symbol."""
+        return sorted(self._known_partition_files(symbol, pattern))
+
+    def _add_partition_file(self, symbol: str, filepath: Path) -> None:
+        """Record a written partition file if the symbol's listing is cached."""
+        if self._partition_files is not None and symbol in self._partition_files:
+            self._partition_files[symbol].add(filepath)
+
     @abstractmethod
     def save(self, symbol: str, df: pd.DataFrame) -> None:
         """Save data for a symbol."""
@@ -137,6 +177,8 @@ class SingleFileStorage(StorageBackend):
 class DailyPartitionedStorage(StorageBackend):
     """Store data partitioned by day (Hive-style: symbol/year=YYYY/month=MM/day=DD/)."""
 
+    _PARTITION_GLOB = "year=*/month=*/day=*/*.parquet"
+
     def _get_symbol_dir(self, symbol: str) -> Path:
         return self.data_dir / self._get_symbol_folder(symbol)
 
@@ -150,12 +192,6 @@ class DailyPartitionedStorage(StorageBackend):
             / f"{folder}.parquet"
         )
 
-    def _get_partition_files(self, symbol: str) -> list[Path]:
-        symbol_dir = self._get_symbol_dir(symbol)
-        if not symbol_dir.exists():
-            return []
-        return sorted(symbol_dir.glob("year=*/month=*/day=*/*.parquet"))
-
     def save(self, symbol: str, df: pd.DataFrame) -> None:
         df = _prepare_dataframe(df, datetime_index=False)  # Keep datetime as column for groupby
         for date, group in df.groupby(df["datetime"].dt.date):
@@ -164,9 +200,10 @@ class DailyPartitionedStorage(StorageBackend):
             if self.datetime_index:
                 group = group.set_index("datetime")
             group.to_parquet(filepath, index=self.datetime_index, compression=self.compression)
+            self._add_partition_file(symbol, filepath)
 
     def load(self, symbol: str) -> pd.DataFrame | None:
-        files = self._get_partition_files(symbol)
+        files = self._get_partition_files(symbol, self._PARTITION_GLOB)
         if not files:
             return None
         try:
@@ -185,11 +222,11 @@ class DailyPartitionedStorage(StorageBackend):
         return sorted(symbols)
 
     def get_file_size(self, symbol: str) -> int:
-        return sum(f.stat().st_size for f in self._get_partition_files(symbol))
+        return sum(f.stat().st_size for f in self._scan_partition_files(symbol, self._PARTITION_GLOB))
 
     def get_last_timestamp(self, symbol: str) -> datetime | None:
         """Get last timestamp by reading only the latest partition."""
-        files = self._get_partition_files(symbol)
+        files = self._get_partition_files(symbol, self._PARTITION_GLOB)
         if not files:
             return None
         try:
@@ -229,11 +266,14 @@ class DailyPartitionedStorage(StorageBackend):
             if self.datetime_index:
                 group = group.set_index("datetime")
             group.to_parquet(filepath, index=self.datetime_index, compression=self.compression)
+            self._add_partition_file(symbol, filepath)
 
 
 class MonthlyPartitionedStorage(StorageBackend):
     """Store data partitioned by month (Hive-style: symbol/year_month=YYYY-MM/)."""
 
+    _PARTITION_GLOB = "year_month=*/*.parquet"
+
     def _get_symbol_dir(self, symbol: str) -> Path:
         return self.data_dir / self._get_symbol_folder(symbol)
 
@@ -245,12 +285,6 @@ class MonthlyPartitionedStorage(StorageBackend):
             / "data-0.parquet"
         )
 
-    def _get_partition_files(self, symbol: str) -> list[Path]:
-        symbol_dir = self._get_symbol_dir(symbol)
-        if not symbol_dir.exists():
-            return []
-        return sorted(symbol_dir.glob("year_month=*/*.parquet"))
-
     def save(self, symbol: str, df: pd.DataFrame) -> None:
         df = _prepare_dataframe(df, datetime_index=False)  # Keep datetime as column for groupby
         for period, group in df.groupby(df["datetime"].dt.to_period("M")):
@@ -259,9 +293,10 @@ class MonthlyPartitionedStorage(StorageBackend):
             if self.datetime_index:
                 group = group.set_index("datetime")
             group.to_parquet(filepath, index=self.datetime_index, compression=self.compression)
+            self._add_partition_file(symbol, filepath)
 
     def load(self, symbol: str) -> pd.DataFrame | None:
-        files = self._get_partition_files(symbol)
+        files = self._get_partition_files(symbol, self._PARTITION_GLOB)
         if not files:
             return None
         try:
@@ -280,11 +315,11 @@ class MonthlyPartitionedStorage(StorageBackend):
         return sorted(symbols)
 
     def get_file_size(self, symbol: str) -> int:
-        return sum(f.stat().st_size for f in self._get_partition_files(symbol))
+        return sum(f.stat().st_size for f in self._scan_partition_files(symbol, self._PARTITION_GLOB))
 
     def get_last_timestamp(self, symbol: str) -> datetime | None:
         """Get last timestamp by reading only the latest partition."""
-        files = self._get_partition_files(symbol)
+        files = self._get_partition_files(symbol, self._PARTITION_GLOB)
         if not files:
             return None
         try:
@@ -324,6 +359,7 @@ class MonthlyPartitionedStorage(StorageBackend):
             if self.datetime_index:
                 group = group.set_index("datetime")
             group.to_parquet(filepath, index=self.datetime_index, compression=self.compression)
+            self._add_partition_file(symbol, filepath)
 
 
 _BACKENDS = {